@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 
-import subprocess
+import asyncio
 import logging
+import os
 from pathlib import Path
 from obj_parser import ObjParser
 from errors import ModelConversionError
@@ -11,15 +12,18 @@ logger = logging.getLogger(__name__)
 
 class ModelConverter:
 
-    def convert_obj_to_dae(self, obj_path: str, output_dir: str) -> str:
+    async def convert_obj_to_dae(self, obj_path: str, output_dir: str) -> str:
         raise NotImplementedError("Subclasses must implement convert_obj_to_dae")
 
 
 class AssimpModelConverter(ModelConverter):
-    def convert_obj_to_dae(self, obj_path: str, output_dir: str) -> str:
+    async def convert_obj_to_dae(self, obj_path: str, output_dir: str) -> str:
         """
         Convert an OBJ file to DAE format using assimp.
 
+        The assimp subprocess is awaited asynchronously so other pipeline
+        stages can run while it works.
+
         Args:
             obj_path: Path to the OBJ file
             output_dir: Directory to save the DAE file
@@ -30,36 +34,58 @@ class AssimpModelConverter(ModelConverter):
         obj_path = Path(obj_path)
         dae_path = Path(output_dir) / f"{obj_path.stem}.dae"
 
-        try:
-            cmd = [
-                "assimp", "export",
-                str(obj_path),
-                str(dae_path),
-                "-f", "collada",
-                "--post-process", "Triangulate,GenerateNormals,OptimizeMeshes"
-            ]
-
-            subprocess.run(cmd, capture_output=True, text=True, check=True)
-            logger.info("Converted OBJ to DAE successfully")
-            return str(dae_path)
-
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Error converting OBJ to DAE: {e}\nstderr: {e.stderr}")
-            raise ModelConversionError(f"Failed to convert OBJ to DAE: {e}") from e
-
-
-def get_texture_paths(obj_path: str) -> list[str]:
+        cmd = [
+            "assimp", "export",
+            str(obj_path),
+            str(dae_path),
+            "-f", "collada",
+            "--post-process", "Triangulate,GenerateNormals,OptimizeMeshes"
+        ]
+
+        # Discard stdout instead of buffering assimp's (potentially verbose)
+        # log output in memory; stderr is only decoded on failure
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await process.communicate()
+
+        if process.returncode != 0:
+            logger.error(f"Error converting OBJ to DAE: assimp exited with code {process.returncode}\n"
+                         f"stderr: {stderr.decode(errors='replace')}")
+            raise ModelConversionError(f"Failed to convert OBJ to DAE: assimp exited with code {process.returncode}")
+
+        logger.info("Converted OBJ to DAE successfully")
+        return str(dae_path)
+
+
+def get_texture_paths(obj_path: str, mtl_file: str = None) -> list[str]:
+    """
+    Resolve texture files referenced by the OBJ's material library.
+
+    Args:
+        obj_path: Path to the OBJ file
+        mtl_file: Material file name if already known from an earlier OBJ
+            scan; skips re-reading the OBJ to find the mtllib directive
+
+    Returns:
+        list[str]: Paths of texture files that exist on disk
+    """
     logger.info("Getting texture files...")
     obj_path = Path(obj_path)
     obj_dir = obj_path.parent
     texture_files = []
 
     try:
-        texture_refs = ObjParser.get_texture_files(obj_path)
+        texture_refs = ObjParser.get_texture_files(obj_path, mtl_file)
 
+        # One directory listing instead of a stat per texture reference;
+        # references pointing into subdirectories fall back to a stat
+        present = {entry.name for entry in os.scandir(obj_dir)}
         for texture_ref in texture_refs:
             src_path = obj_dir / texture_ref
-            if src_path.exists():
+            if texture_ref in present or src_path.exists():
                 texture_files.append(str(src_path))
 
         logger.info(f"Found {len(texture_files)} texture files")
@@ -3,8 +3,6 @@ import sys
 import argparse
 import logging
 
-from pipeline import Pipeline
-from assimp_converter import AssimpModelConverter
 from errors import ConverterScriptError
 
 
@@ -59,6 +57,11 @@ Examples:
 
     setup_logging(verbose=args.verbose)
 
+    # Imported after argument parsing so --help/usage errors don't pay for
+    # loading numpy/pyproj
+    from pipeline import Pipeline
+    from assimp_converter import AssimpModelConverter
+
     try:
         model_converter = AssimpModelConverter()
         pipeline = Pipeline(model_converter)
@@ -1,14 +1,40 @@
 #!/usr/bin/env python3
 import logging
+import math
 from enum import Enum
+from functools import lru_cache
 
-import pyproj
 from errors import GeoreferencingError
 
 logger = logging.getLogger(__name__)
 
-WGS84_PROJ_STRING = "+proj=longlat +ellps=WGS84 +datum=WGS84 +no_defs"
-UTM_PROJ_STRING_TEMPLATE = "+proj=utm +ellps=WGS84 +datum=WGS84 +units=m +no_defs"
+WGS84_EPSG = 4326
+UTM_NORTH_EPSG_BASE = 32600  # EPSG code for UTM zone N is 32600 + zone
+UTM_SOUTH_EPSG_BASE = 32700  # EPSG code for UTM zone S is 32700 + zone
+
+# WGS84 ellipsoid and UTM projection constants for the closed-form inverse
+_WGS84_A = 6378137.0
+_WGS84_F = 1 / 298.257223563
+_UTM_K0 = 0.9996
+_UTM_FALSE_EASTING = 500_000.0
+_UTM_FALSE_NORTHING_SOUTH = 10_000_000.0
+
+# Fourth-order Krueger series coefficients (third flattening n); good to
+# well under a millimeter for UTM-range coordinates
+_N3 = _WGS84_F / (2 - _WGS84_F)
+_RECTIFYING_RADIUS = _WGS84_A / (1 + _N3) * (1 + _N3 ** 2 / 4 + _N3 ** 4 / 64)
+_BETA = (
+    _N3 / 2 - 2 * _N3 ** 2 / 3 + 37 * _N3 ** 3 / 96 - _N3 ** 4 / 360,
+    _N3 ** 2 / 48 + _N3 ** 3 / 15 - 437 * _N3 ** 4 / 1440,
+    17 * _N3 ** 3 / 480 - 37 * _N3 ** 4 / 840,
+    4397 * _N3 ** 4 / 161280,
+)
+_DELTA = (
+    2 * _N3 - 2 * _N3 ** 2 / 3 - 2 * _N3 ** 3 + 116 * _N3 ** 4 / 45,
+    7 * _N3 ** 2 / 3 - 8 * _N3 ** 3 / 5 - 227 * _N3 ** 4 / 45,
+    56 * _N3 ** 3 / 15 - 136 * _N3 ** 4 / 35,
+    4279 * _N3 ** 4 / 630,
+)
 
 
 class Hemisphere(Enum):
@@ -59,20 +85,74 @@ def read_georeferencing_file(georef_path: str) -> tuple[float, float, int, Hemis
         raise GeoreferencingError(f"Failed to read georeferencing file: {e}") from e
 
 
-def utm_to_wgs84(easting: float, northing: float, utm_zone: int, hemisphere: Hemisphere) -> tuple[float, float]:
+def utm_to_wgs84(easting: float, northing: float, utm_zone: int, hemisphere: Hemisphere,
+                 use_pyproj: bool = False) -> tuple[float, float]:
     """
     Convert UTM coordinates to WGS84 latitude/longitude.
-    
+
+    Uses the closed-form Krueger-series inverse by default, which converts a
+    single point in microseconds; pass use_pyproj=True to route through PROJ
+    instead.
+
     Args:
         easting: UTM easting coordinate
         northing: UTM northing coordinate
         utm_zone: UTM zone number
         hemisphere: Hemisphere enum value (NORTH or SOUTH)
-        
+        use_pyproj: Force the conversion through a pyproj Transformer
+
     Returns:
         tuple[float, float]: (longitude, latitude)
     """
-    utm_proj_string = f"{UTM_PROJ_STRING_TEMPLATE} +zone={utm_zone} +{hemisphere.projection_value}"
-    transformer = pyproj.Transformer.from_crs(utm_proj_string, WGS84_PROJ_STRING, always_xy=True)
-    longitude, latitude = transformer.transform(easting, northing)
-    return longitude, latitude
+    if use_pyproj:
+        transformer = _get_transformer(utm_zone, hemisphere.code)
+        longitude, latitude = transformer.transform(easting, northing)
+        return longitude, latitude
+
+    return _utm_inverse(easting, northing, utm_zone, hemisphere is Hemisphere.NORTH)
+
+
+def _utm_inverse(easting: float, northing: float, utm_zone: int, north: bool) -> tuple[float, float]:
+    """Closed-form UTM->WGS84 inverse (fourth-order Krueger series)."""
+    x = easting - _UTM_FALSE_EASTING
+    y = northing if north else northing - _UTM_FALSE_NORTHING_SOUTH
+
+    xi = y / (_UTM_K0 * _RECTIFYING_RADIUS)
+    eta = x / (_UTM_K0 * _RECTIFYING_RADIUS)
+
+    xi_prime = xi
+    eta_prime = eta
+    for j, beta in enumerate(_BETA, start=1):
+        xi_prime -= beta * math.sin(2 * j * xi) * math.cosh(2 * j * eta)
+        eta_prime -= beta * math.cos(2 * j * xi) * math.sinh(2 * j * eta)
+
+    # Conformal latitude back to geodetic latitude
+    chi = math.asin(math.sin(xi_prime) / math.cosh(eta_prime))
+    latitude = chi
+    for j, delta in enumerate(_DELTA, start=1):
+        latitude += delta * math.sin(2 * j * chi)
+
+    central_meridian = math.radians(utm_zone * 6 - 183)
+    longitude = central_meridian + math.atan2(math.sinh(eta_prime), math.cos(xi_prime))
+
+    # Wrap to [-180, 180) for points crossing the antimeridian (zones 1/60)
+    longitude = (math.degrees(longitude) + 180.0) % 360.0 - 180.0
+
+    return longitude, math.degrees(latitude)
+
+
+@lru_cache(maxsize=128)
+def _get_transformer(utm_zone: int, hemisphere_code: str) -> 'pyproj.Transformer':
+    """
+    Build (and memoize) the UTM->WGS84 transformer for a zone/hemisphere.
+
+    PROJ CRS construction involves database lookups costing milliseconds,
+    which dominates batch-conversion workflows; EPSG-code construction is
+    also markedly faster than PROJ-string parsing.
+    """
+    # Deferred so importing this module doesn't pay PROJ's startup cost
+    import pyproj
+
+    epsg_base = UTM_NORTH_EPSG_BASE if hemisphere_code == Hemisphere.NORTH.code else UTM_SOUTH_EPSG_BASE
+    utm_crs = pyproj.CRS.from_epsg(epsg_base + utm_zone)
+    return pyproj.Transformer.from_crs(utm_crs, pyproj.CRS.from_epsg(WGS84_EPSG), always_xy=True)
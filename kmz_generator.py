@@ -1,45 +1,76 @@
 #!/usr/bin/env python3
 import os
+import shutil
+import string
 import zipfile
 import logging
 from pathlib import Path
+from xml.sax.saxutils import escape
+
+try:
+    from isal import isal_zlib
+
+    # ISA-L's SIMD-accelerated DEFLATE is a drop-in for the compressobj API
+    # zipfile uses and is typically 2-5x faster than stock zlib; fall back
+    # silently on platforms without an isal wheel
+    zipfile.zlib = isal_zlib
+except ImportError:
+    pass
 
 logger = logging.getLogger(__name__)
 
+# Read once at import; string.Template also tolerates literal braces in the
+# KML, which str.format would choke on
+_KML_TEMPLATE = string.Template(
+    (Path(__file__).parent / "kml_template.xml").read_text(encoding='utf-8'))
 
-def create_kml_content(dae_filename: str, longitude: float, latitude: float, 
-                    heading: float, tilt: float, roll: float) -> str:
-    template_path = Path(__file__).parent / "kml_template.xml"
+# Only text-like entries benefit from DEFLATE; textures (jpg/png/...) are
+# already compressed and just waste CPU going through zlib again
+_COMPRESSIBLE_EXTENSIONS = {'.kml', '.dae', '.xml', '.mtl', '.obj'}
 
-    try:
-        with open(template_path, 'r', encoding='utf-8') as f:
-            template_content = f.read()
-
-        kml_content = template_content.format(
-            longitude=longitude,
-            latitude=latitude,
-            dae_filename=dae_filename,
-            heading=heading,
-            tilt=tilt,
-            roll=roll
-        )
-
-        return kml_content
-
-    except FileNotFoundError:
-        raise FileNotFoundError(f"KML template not found: {template_path}")
-    except Exception as e:
-        raise RuntimeError(f"Failed to process KML template: {e}")
+# Level 1 is ~3x faster than the default 6 at ~10% worse ratio, which is a
+# good trade for transient KMZ output
+_DEFLATE_LEVEL = 1
+
+_COPY_BLOCK_SIZE = 1 << 20  # Block size for streaming texture files into the zip
+
+
+def _compression_type(filename: str) -> int:
+    extension = os.path.splitext(filename)[1].lower()
+    return zipfile.ZIP_DEFLATED if extension in _COMPRESSIBLE_EXTENSIONS else zipfile.ZIP_STORED
+
+
+def create_kml_content(dae_filename: str, longitude: float, latitude: float,
+                    heading: float, tilt: float, roll: float, altitude: float = 0.0) -> str:
+    return _KML_TEMPLATE.substitute(
+        longitude=longitude,
+        latitude=latitude,
+        # The file name comes from user input and may contain XML-special
+        # characters (e.g. '&'); the numeric fields are safe as-is
+        dae_filename=escape(dae_filename),
+        heading=heading,
+        tilt=tilt,
+        roll=roll,
+        altitude=altitude
+    )
 
 
 def create_kmz(kml_content: str, dae_path: str, texture_files: list[str], output_kmz_path: str) -> str:
     try:
-        with zipfile.ZipFile(output_kmz_path, 'w', zipfile.ZIP_DEFLATED) as kmz:
-            kmz.writestr('doc.kml', kml_content)
-            kmz.write(dae_path, os.path.basename(dae_path))
-            for texture_file in texture_files:
-                if os.path.exists(texture_file):
-                    kmz.write(texture_file, os.path.basename(texture_file))
+        with zipfile.ZipFile(output_kmz_path, 'w', allowZip64=True) as kmz:
+            kmz.writestr('doc.kml', kml_content,
+                         compress_type=zipfile.ZIP_DEFLATED, compresslevel=_DEFLATE_LEVEL)
+            kmz.write(dae_path, os.path.basename(dae_path),
+                      compress_type=zipfile.ZIP_DEFLATED, compresslevel=_DEFLATE_LEVEL)
+
+            # Largest textures first, streamed in 1 MiB blocks; textures from
+            # get_texture_paths are already existence-checked
+            for texture_file in sorted(texture_files, key=os.path.getsize, reverse=True):
+                info = zipfile.ZipInfo.from_file(texture_file, os.path.basename(texture_file))
+                info.compress_type = _compression_type(texture_file)
+                with kmz.open(info, 'w', force_zip64=True) as dest, \
+                        open(texture_file, 'rb') as src:
+                    shutil.copyfileobj(src, dest, _COPY_BLOCK_SIZE)
 
         logger.info(f"Successfully created KMZ file: {output_kmz_path}")
         return output_kmz_path
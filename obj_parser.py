@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import logging
+import re
 from pathlib import Path
 from typing import Optional
 
@@ -7,16 +8,26 @@ logger = logging.getLogger(__name__)
 
 DIFFUSE_MAP_KEY = 'map_Kd'
 
+# Pulls every diffuse-map reference out of an MTL in one C-level scan
+_DIFFUSE_MAP_RE = re.compile(rf'^{DIFFUSE_MAP_KEY}[ \t]+(.+?)\s*$', re.MULTILINE)
+
+# Once any of these appears, the OBJ header is over and no mtllib will follow
+_GEOMETRY_PREFIXES = (b'v ', b'f ', b'g ', b'o ', b'vt', b'vn')
+
 
 class ObjParser:
 
     @staticmethod
-    def get_texture_files(obj_path: Path) -> set[str]:
+    def get_texture_files(obj_path: Path, mtl_file: Optional[str] = None) -> set[str]:
         """
         Get all texture files referenced by an OBJ file.
+
+        If the material file name was already captured by an earlier scan it
+        can be passed in to avoid re-reading the OBJ.
         """
         obj_dir = obj_path.parent
-        mtl_file = ObjParser._find_mtl_file(obj_path)
+        if mtl_file is None:
+            mtl_file = ObjParser._find_mtl_file(obj_path)
 
         if mtl_file:
             mtl_path = obj_dir / mtl_file
@@ -28,11 +39,17 @@ class ObjParser:
     def _find_mtl_file(obj_path: Path) -> Optional[str]:
         """
         Find the material file reference in the OBJ file.
+
+        mtllib conventionally sits in the header, so the scan stops at the
+        first geometry line instead of reading the whole file when the
+        directive is absent.
         """
-        with open(obj_path, 'r') as f:
+        with open(obj_path, 'rb', buffering=65536) as f:
             for line in f:
-                if line.startswith('mtllib '):
-                    return line.split(' ', 1)[1].strip()
+                if line.startswith(b'mtllib '):
+                    return line.split(b' ', 1)[1].strip().decode()
+                if line.startswith(_GEOMETRY_PREFIXES):
+                    return None
         return None
 
     @staticmethod
@@ -43,12 +60,7 @@ class ObjParser:
         texture_refs = set()
 
         if mtl_path.exists():
-            with open(mtl_path, 'r') as f:
-                mtl_content = f.read()
-
-            for line in mtl_content.split('\n'):
-                if line.startswith(DIFFUSE_MAP_KEY):
-                    texture_file = line.split(' ', 1)[1].strip()
-                    texture_refs.add(texture_file)
+            mtl_content = mtl_path.read_text()
+            texture_refs.update(_DIFFUSE_MAP_RE.findall(mtl_content))
 
         return texture_refs
@@ -1,16 +1,15 @@
 #!/usr/bin/env python3
+import asyncio
 import logging
 import os
 import tempfile
-from typing import Optional
-from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
 from georeferencing import read_georeferencing_file, utm_to_wgs84
 from kmz_generator import create_kml_content, create_kmz
 from assimp_converter import get_texture_paths, ModelConverter
-from z_offset_utils import calculate_z_offset, apply_z_offset_to_obj
+from z_offset_utils import calculate_z_offset
 
 
 class Pipeline:
@@ -24,32 +23,56 @@ class Pipeline:
                       heading: float = 180,
                       tilt: float = -90,
                       roll: float = 0) -> None:
+        asyncio.run(self._convert_async(obj_file, georef_file, output_kmz,
+                                        no_textures, heading, tilt, roll))
+
+    async def _convert_async(self, obj_file: str,
+                             georef_file: str,
+                             output_kmz: str,
+                             no_textures: bool = False,
+                             heading: float = 180,
+                             tilt: float = -90,
+                             roll: float = 0) -> None:
         logger.info("Starting OBJ to KMZ conversion...")
 
         self._validate_inputs(obj_file, georef_file)
         self._ensure_output_directory(output_kmz)
 
+        # Georeferencing and the RANSAC vertex scan read independent files,
+        # so run them concurrently in the default executor
+        loop = asyncio.get_running_loop()
         logger.info("Reading georeferencing information...")
-        easting, northing, utm_zone, hemisphere = read_georeferencing_file(georef_file)
+        georef_future = loop.run_in_executor(None, read_georeferencing_file, georef_file)
+        z_offset_future = loop.run_in_executor(None, calculate_z_offset, obj_file)
+
+        (easting, northing, utm_zone, hemisphere), (z_offset, mtl_file) = \
+            await asyncio.gather(georef_future, z_offset_future)
+
+        # Texture discovery reuses the mtllib name captured by the vertex
+        # scan, so it only touches the (small) MTL file; overlap it with the
+        # conversion below
+        texture_future = None if no_textures \
+            else loop.run_in_executor(None, get_texture_paths, obj_file, mtl_file)
+
         longitude, latitude = utm_to_wgs84(easting, northing, utm_zone, hemisphere)
         logger.info(
             f"UTM: {easting}, {northing} (Zone {utm_zone}{hemisphere.code}) | WGS84: {longitude:.6f}, {latitude:.6f}")
 
-        z_offset = calculate_z_offset(obj_file)
-
-        with tempfile.TemporaryDirectory() as temp_dir, \
-             self._aligned_obj_file(obj_file, z_offset) as obj_file_to_convert:
-
+        with tempfile.TemporaryDirectory() as temp_dir:
             logger.info("Converting OBJ to DAE format...")
-            dae_path = self.converter.convert_obj_to_dae(obj_file_to_convert, temp_dir)
+            dae_path = await self.converter.convert_obj_to_dae(obj_file, temp_dir)
             dae_filename = os.path.basename(dae_path)
 
-            texture_files = []
-            if not no_textures:
-                texture_files = get_texture_paths(obj_file)
+            texture_files = await texture_future if texture_future is not None else []
+
+            # Ground the model via the KML altitude instead of rewriting the
+            # whole OBJ with shifted vertices
+            if z_offset != 0:
+                logger.info(f"Applying ground plane alignment offset of {z_offset:.3f} via KML altitude...")
 
             logger.info("Creating KMZ package...")
-            kml_file_path = create_kml_content(dae_filename, longitude, latitude, heading, tilt, roll)
+            kml_file_path = create_kml_content(dae_filename, longitude, latitude, heading, tilt, roll,
+                                               altitude=-z_offset)
             create_kmz(kml_file_path, dae_path, texture_files, output_kmz)
 
         logger.info(f"Conversion completed successfully! Output: {output_kmz}")
@@ -63,24 +86,4 @@ class Pipeline:
     def _ensure_output_directory(self, output_kmz: str) -> None:
         output_dir = os.path.dirname(output_kmz)
         if output_dir and not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-
-    @contextmanager
-    def _aligned_obj_file(self, obj_file: str, z_offset: float):
-        """Context manager that creates and cleans up aligned OBJ file."""
-        if z_offset == 0:
-            yield obj_file
-            return
-
-        obj_dir = os.path.dirname(obj_file)
-        obj_name = os.path.splitext(os.path.basename(obj_file))[0]
-        aligned_obj_path = os.path.join(obj_dir, f"{obj_name}_aligned.obj")
-
-        try:
-            logger.info(f"Applying ground plane alignment offset of {z_offset:.3f}...")
-            apply_z_offset_to_obj(obj_file, aligned_obj_path, z_offset)
-            yield aligned_obj_path
-        finally:
-            if os.path.exists(aligned_obj_path):
-                logger.debug(f"Cleaning up temporary file: {aligned_obj_path}")
-                os.remove(aligned_obj_path)
\ No newline at end of file
+            os.makedirs(output_dir)
\ No newline at end of file
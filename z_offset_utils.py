@@ -4,10 +4,17 @@ Utilities for analyzing and manipulating Z-coordinates in 3D models.
 """
 
 import logging
-from typing import List
+import mmap
+import os
+import queue
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from multiprocessing import shared_memory
+from typing import Optional
 
 import numpy as np
-import pyransac3d as pyrsc
 
 from errors import FileProcessingError
 
@@ -17,27 +24,78 @@ VERTEX_PREFIX = 'v '
 EPSILON = 1e-6  # Small value for numerical comparisons
 DEFAULT_THRESHOLD = 0.1  # Default distance threshold for RANSAC inlier points
 DEFAULT_MAX_ITERATIONS = 1000  # Default maximum RANSAC iterations
+DEFAULT_SUBSAMPLE_SIZE = 50_000  # Default vertex subsample for plane fitting (None disables)
 
+# Vertices parse to float32 by default: OBJ text rarely carries more than
+# seven significant digits, and halving the element size halves the memory
+# bandwidth of the RANSAC distance passes. Set OBJ2KMZ_FLOAT64=1 (or
+# true/yes) to force full double precision; 0/false/no and unset keep float32.
+VERTEX_DTYPE = (np.float64
+                if os.environ.get('OBJ2KMZ_FLOAT64', '').strip().lower() in {'1', 'true', 'yes'}
+                else np.float32)
 
-def calculate_z_offset(obj_path: str, threshold: float = DEFAULT_THRESHOLD, max_iterations: int = DEFAULT_MAX_ITERATIONS) -> float:
+# Matches "v <x> <y> <z>" lines; extra tokens (e.g. vertex colors) are ignored
+_VERTEX_RE = re.compile(rb'^[ \t]*v[ \t]+(\S+)[ \t]+(\S+)[ \t]+(\S+)', re.MULTILINE)
+
+# Same lines, but splitting a vertex line into (everything through Y, Z) so
+# the rewrite only ever touches the Z token
+_VERTEX_Z_RE = re.compile(rb'^([ \t]*v[ \t]+\S+[ \t]+\S+[ \t]+)(\S+)', re.MULTILINE)
+
+# Material library directive, captured during the vertex scan so texture
+# discovery does not have to re-read the OBJ
+_MTLLIB_RE = re.compile(rb'^[ \t]*mtllib[ \t]+(.+?)[ \t]*\r?$', re.MULTILINE)
+
+_SCAN_CHUNK_BYTES = 64 << 20  # Chunk size for streaming vertex scans (64 MiB)
+_APPLY_CHUNK_BYTES = 8 << 20  # Block size for the streaming Z-offset rewrite (8 MiB)
+_PARALLEL_PARSE_MIN_BYTES = 256 << 20  # Parse byte ranges in parallel above this file size
+
+_RANSAC_BATCH = 64  # Candidate planes evaluated per vectorized pass
+_RANSAC_BLOCK = 65536  # Vertices per distance-evaluation block (bounds memory)
+_RANSAC_PARALLEL_MIN_VERTICES = 200_000  # Below this, process spawn overhead dominates
+
+
+def calculate_z_offset(obj_path: str, threshold: float = DEFAULT_THRESHOLD, max_iterations: int = DEFAULT_MAX_ITERATIONS,
+                       subsample_size: Optional[int] = DEFAULT_SUBSAMPLE_SIZE) -> tuple[float, Optional[str]]:
     """
     Calculate optimal Z offset using RANSAC plane fitting.
 
+    The OBJ is scanned exactly once; the mtllib directive is captured during
+    the same pass so callers can skip a second scan for texture discovery.
+    Results are memoized on (path, size, mtime, parameters), so repeated
+    runs against an unchanged file skip the scan and the fit entirely.
+
     Args:
         obj_path: Path to the OBJ file
         threshold: Distance threshold for inlier points (default: DEFAULT_THRESHOLD)
         max_iterations: Maximum RANSAC iterations (default: DEFAULT_MAX_ITERATIONS)
+        subsample_size: Fit the plane on a uniform random subsample of this
+            many vertices (default: DEFAULT_SUBSAMPLE_SIZE); None fits on all
 
     Returns:
-        float: optimal_offset
+        tuple[float, Optional[str]]: (optimal_offset, mtl file referenced by the OBJ, if any)
+    """
+    stat = os.stat(obj_path)
+    return _cached_z_offset(os.path.abspath(obj_path), stat.st_size, stat.st_mtime_ns,
+                            threshold, max_iterations, subsample_size)
+
+
+@lru_cache(maxsize=32)
+def _cached_z_offset(obj_path: str, size: int, mtime_ns: int, threshold: float,
+                     max_iterations: int, subsample_size: Optional[int]) -> tuple[float, Optional[str]]:
+    """
+    Memoized body of calculate_z_offset.
+
+    size and mtime_ns only serve as cache-invalidation keys: any change to
+    the file produces a fresh entry, while stale entries for the old stat
+    simply age out of the LRU.
     """
     logger.info("Analyzing model geometry using RANSAC plane fitting...")
 
-    vertices = _extract_all_vertices_from_obj(obj_path)
-    optimal_offset = _calculate_z_offset(vertices, threshold, max_iterations)
+    vertices, mtl_file = _extract_all_vertices_from_obj(obj_path, subsample_size)
+    optimal_offset = _calculate_z_offset(vertices, threshold, max_iterations, subsample_size)
 
-    logger.info(f"RANSAC plane fitting complete. Ground plane offset: {optimal_offset:.3f}")
-    return optimal_offset
+    logger.info("RANSAC plane fitting complete. Ground plane offset: %.3f", optimal_offset)
+    return optimal_offset, mtl_file
 
 
 def apply_z_offset_to_obj(input_obj: str, output_obj: str, z_offset: float) -> None:
@@ -49,54 +107,333 @@ def apply_z_offset_to_obj(input_obj: str, output_obj: str, z_offset: float) -> N
         output_obj: Path to output OBJ file
         z_offset: Z offset to subtract from all vertices
     """
-    logger.info(f"Subtracting Z offset: {z_offset} and creating grounded OBJ: {output_obj}")
+    logger.info("Subtracting Z offset: %s and creating grounded OBJ: %s", z_offset, output_obj)
+
+    # A reader thread keeps the next blocks in flight while the main thread
+    # transforms and writes, so read latency overlaps with compute instead
+    # of adding to it; the bounded queue caps memory at a few blocks
+    blocks: queue.Queue = queue.Queue(maxsize=4)
+    stop = threading.Event()  # Lets the consumer unblock the reader on error
+
+    def _put_block(item) -> bool:
+        # Bounded put that gives up once the consumer has bailed out, so an
+        # error on the consumer side never leaves the reader blocked on a
+        # full queue (holding the input file open) for the process lifetime
+        while not stop.is_set():
+            try:
+                blocks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _read_blocks() -> None:
+        try:
+            with open(input_obj, 'rb') as f_in:
+                while chunk := f_in.read(_APPLY_CHUNK_BYTES):
+                    if not _put_block(chunk):
+                        return
+        except Exception as e:  # Surfaced by the consumer below
+            _put_block(e)
+        else:
+            _put_block(None)
+
+    reader = threading.Thread(target=_read_blocks, daemon=True)
+    reader.start()
 
     try:
-        with open(input_obj, 'r') as f_in, \
-                open(output_obj, 'w') as f_out:
-
-            for line_num, line in enumerate(f_in, 1):
-                processed_line = _process_obj_line_with_z_offset(line, z_offset)
-                f_out.write(processed_line)
+        try:
+            # Reserve the expected output size up front so the kernel allocates
+            # one large extent instead of growing the file write by write; the
+            # input size is a close estimate since only Z tokens change length.
+            # The slack (or shortfall) is trimmed by the truncate below.
+            out_fd = os.open(output_obj, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            input_size = os.path.getsize(input_obj)
+            if input_size and hasattr(os, 'posix_fallocate'):
+                try:
+                    os.posix_fallocate(out_fd, 0, input_size)
+                except OSError:  # Not supported by this filesystem
+                    pass
+
+            # Output is unbuffered: every write below is a multi-megabyte block,
+            # so Python's userspace write buffer would only add an extra copy
+            with os.fdopen(out_fd, 'wb', buffering=0) as f_out:
+                # Process newline-aligned blocks so memory stays bounded and the
+                # output is written in large sequential chunks instead of holding
+                # (and emitting) the whole rewritten file at once
+                carry = b''
+                while (chunk := blocks.get()) is not None:
+                    if isinstance(chunk, Exception):
+                        raise chunk
+                    chunk = carry + chunk
+                    newline = chunk.rfind(b'\n')
+                    if newline == -1:
+                        carry = chunk
+                        continue
+                    carry = chunk[newline + 1:]
+                    f_out.write(_offset_vertex_lines(chunk[:newline + 1], z_offset))
+
+                if carry:
+                    f_out.write(_offset_vertex_lines(carry, z_offset))
+
+                f_out.truncate()  # Trim preallocated slack past the final byte
+
+        finally:
+            stop.set()
+            reader.join()
 
     except Exception as e:
-        logger.error(f"Error processing file: {e}")
+        logger.error("Error processing file: %s", e)
         raise FileProcessingError(f"Failed to process OBJ file: {e}") from e
 
-    logger.info(f"Successfully processed OBJ file with Z offset: {z_offset}, output: {output_obj}")
+    logger.info("Successfully processed OBJ file with Z offset: %s, output: %s", z_offset, output_obj)
+
+
+def ground_obj(input_obj: str, output_obj: str, threshold: float = DEFAULT_THRESHOLD,
+               max_iterations: int = DEFAULT_MAX_ITERATIONS,
+               subsample_size: Optional[int] = DEFAULT_SUBSAMPLE_SIZE) -> float:
+    """
+    Compute the ground-plane Z offset and write a grounded OBJ in one pass.
+
+    Fuses calculate_z_offset and apply_z_offset_to_obj for callers that want
+    a physically grounded file on disk: the input is read once, the plane is
+    fitted on the vertices parsed from that same buffer, and the adjusted
+    file is written once. Grounding a file onto itself is safe; the result
+    is staged to a temporary file and atomically renamed into place.
+
+    Args:
+        input_obj: Path to input OBJ file
+        output_obj: Path to output OBJ file (may equal input_obj)
+        threshold: Distance threshold for inlier points (default: DEFAULT_THRESHOLD)
+        max_iterations: Maximum RANSAC iterations (default: DEFAULT_MAX_ITERATIONS)
+        subsample_size: Vertex subsample for plane fitting (None fits on all)
+
+    Returns:
+        float: the Z offset that was subtracted
+    """
+    logger.info("Grounding OBJ in a single pass: %s -> %s", input_obj, output_obj)
 
+    try:
+        with open(input_obj, 'rb') as f_in:
+            data = f_in.read()
+
+        matches = _VERTEX_RE.findall(data)
+        if not matches:
+            raise ValueError("No valid vertices found in OBJ file")
+        vertices = np.array(matches, dtype=VERTEX_DTYPE)
+
+        z_offset = _calculate_z_offset(vertices, threshold, max_iterations, subsample_size)
+        rewritten = _offset_vertex_lines(data, z_offset)
+
+        if os.path.abspath(input_obj) == os.path.abspath(output_obj):
+            staging_path = output_obj + '.tmp'
+            with open(staging_path, 'wb') as f_out:
+                f_out.write(rewritten)
+            os.replace(staging_path, output_obj)
+        else:
+            with open(output_obj, 'wb') as f_out:
+                f_out.write(rewritten)
+
+    except Exception as e:
+        logger.error("Error processing file: %s", e)
+        raise FileProcessingError(f"Failed to ground OBJ file: {e}") from e
 
-def _extract_all_vertices_from_obj(obj_path: str) -> np.ndarray:
+    logger.info("Successfully grounded OBJ with Z offset: %s, output: %s", z_offset, output_obj)
+    return z_offset
+
+
+def _extract_all_vertices_from_obj(obj_path: str,
+                                   sample_size: Optional[int] = None) -> tuple[np.ndarray, Optional[str]]:
     """
-    Extract all vertex coordinates from OBJ file as numpy array.
-    
+    Extract vertex coordinates and the mtllib reference from an OBJ file.
+
+    With sample_size set, the file is scanned in chunks and a uniform
+    reservoir sample of at most that many vertices is kept, so peak memory
+    is bounded by the sample instead of the total vertex count.
+
     Args:
         obj_path: Path to the OBJ file
-        
+        sample_size: Keep at most this many uniformly sampled vertices
+            (None keeps all)
+
     Returns:
-        np.ndarray: Array of shape (N, 3) containing vertex coordinates
+        tuple[np.ndarray, Optional[str]]: ((N, 3) vertex coordinates, mtl file name or None)
+    """
+    # Both regex scans run directly over a memory map, so the file is never
+    # copied into a Python bytes object; pages stream straight from the page
+    # cache. float32 halves the bytes the memory-bound RANSAC distance passes
+    # have to stream and is ample for OBJ text precision; only the final
+    # offset arithmetic runs in float64.
+    with open(obj_path, 'rb') as f:
+        try:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty file cannot be mapped
+            raise ValueError("No valid vertices found in OBJ file")
+
+        try:
+            if sample_size is None:
+                if len(buffer) >= _PARALLEL_PARSE_MIN_BYTES and (os.cpu_count() or 1) > 1:
+                    vertices = _extract_vertices_parallel(obj_path, buffer)
+                else:
+                    vertices = _parse_vertices_dense(buffer)
+            else:
+                vertices = _sample_vertices_from_buffer(buffer, sample_size)
+
+            if vertices.shape[0] == 0:
+                raise ValueError("No valid vertices found in OBJ file")
+
+            mtl_match = _MTLLIB_RE.search(buffer)
+            mtl_file = mtl_match.group(1).decode() if mtl_match else None
+        finally:
+            buffer.close()
+
+    return vertices, mtl_file
+
+
+def _parse_vertices_dense(buffer) -> np.ndarray:
+    """
+    Parse every vertex in an OBJ byte buffer into a preallocated array.
+
+    The destination is sized from the byte count up front (OBJ vertex lines
+    average well over 40 bytes) and filled chunk by chunk, so the parse never
+    materializes one Python list of all matches; the estimate doubles in the
+    rare case it falls short.
+    """
+    # 40 bytes/line overestimates the vertex count for typical OBJs, which
+    # also carry faces, normals and texture coordinates in the same bytes
+    n_est = len(buffer) // 40 + 1024
+    vertices = np.empty((n_est, 3), dtype=VERTEX_DTYPE)
+    count = 0
+
+    size = len(buffer)
+    start = 0
+    while start < size:
+        end = min(start + _SCAN_CHUNK_BYTES, size)
+        if end < size:  # Align the chunk to a line boundary
+            newline = buffer.find(b'\n', end)
+            end = size if newline == -1 else newline + 1
+
+        matches = _VERTEX_RE.findall(buffer[start:end])
+        start = end
+        if not matches:
+            continue
+
+        while count + len(matches) > vertices.shape[0]:
+            grown = np.empty((vertices.shape[0] * 2, 3), dtype=VERTEX_DTYPE)
+            grown[:count] = vertices[:count]
+            vertices = grown
+
+        vertices[count:count + len(matches)] = np.array(matches, dtype=VERTEX_DTYPE)
+        count += len(matches)
+
+    return vertices[:count]
+
+
+def _extract_vertices_parallel(obj_path: str, buffer) -> np.ndarray:
     """
-    vertices = []
+    Parse all vertex lines of a large OBJ across a process pool.
+
+    The file is split into newline-aligned byte ranges; each worker maps its
+    range independently and returns its parsed vertices, which are then
+    concatenated in file order.
+    """
+    n_workers = os.cpu_count() or 1
+    boundaries = _find_chunk_boundaries(buffer, n_workers)
+
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        futures = [
+            pool.submit(_parse_vertex_range, obj_path, start, end)
+            for start, end in zip(boundaries, boundaries[1:])
+        ]
+        chunks = [future.result() for future in futures]
 
-    with open(obj_path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line.startswith(VERTEX_PREFIX):
-                parts = line.split()
-                if len(parts) >= 4:
-                    x, y, z = float(parts[1]), float(parts[2]), float(parts[3])
-                    vertices.append([x, y, z])
+    return np.concatenate(chunks) if chunks else np.empty((0, 3), VERTEX_DTYPE)
 
-    if not vertices:
-        raise ValueError("No valid vertices found in OBJ file")
 
-    return np.array(vertices)
+def _find_chunk_boundaries(buffer, n_chunks: int) -> list[int]:
+    """Split a buffer into up to n_chunks byte ranges aligned to newlines."""
+    size = len(buffer)
+    boundaries = [0]
+    for i in range(1, n_chunks):
+        approx = size * i // n_chunks
+        newline = buffer.find(b'\n', approx)
+        boundary = size if newline == -1 else newline + 1
+        if boundary > boundaries[-1] and boundary < size:
+            boundaries.append(boundary)
+    boundaries.append(size)
+    return boundaries
 
 
-def _calculate_z_offset(vertices: np.ndarray, threshold: float, max_iterations: int) -> float:
+def _parse_vertex_range(obj_path: str, start: int, end: int) -> np.ndarray:
+    """Parse the vertex lines within one newline-aligned byte range."""
+    with open(obj_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            matches = _VERTEX_RE.findall(buffer[start:end])
+
+    return np.array(matches, dtype=VERTEX_DTYPE) if matches else np.empty((0, 3), VERTEX_DTYPE)
+
+
+def _sample_vertices_from_buffer(buffer, sample_size: int,
+                                 rng: np.random.Generator = None) -> np.ndarray:
+    """
+    Collect a uniform reservoir sample of vertices from an OBJ byte buffer.
+
+    The buffer is parsed in newline-aligned chunks and the reservoir is
+    updated with vectorized slot draws, so only O(sample_size) vertices are
+    ever held regardless of file size.
+    """
+    if rng is None:
+        rng = np.random.default_rng(0)
+
+    reservoir = np.empty((sample_size, 3), dtype=VERTEX_DTYPE)
+    filled = 0
+    seen = 0
+
+    size = len(buffer)
+    start = 0
+    while start < size:
+        end = min(start + _SCAN_CHUNK_BYTES, size)
+        if end < size:  # Align the chunk to a line boundary
+            newline = buffer.find(b'\n', end)
+            end = size if newline == -1 else newline + 1
+
+        matches = _VERTEX_RE.findall(buffer[start:end])
+        start = end
+        if not matches:
+            continue
+        chunk = np.array(matches, dtype=VERTEX_DTYPE)
+
+        take = min(sample_size - filled, chunk.shape[0])
+        if take:
+            reservoir[filled:filled + take] = chunk[:take]
+            filled += take
+            seen += take
+            chunk = chunk[take:]
+
+        if chunk.shape[0]:
+            # Element i of the chunk replaces a random reservoir slot with
+            # probability sample_size / (seen + i + 1); duplicate slot draws
+            # within one chunk resolve last-writer-wins, which is a standard
+            # vectorized approximation of sequential reservoir sampling
+            slots = rng.integers(0, seen + 1 + np.arange(chunk.shape[0]))
+            accepted = slots < sample_size
+            reservoir[slots[accepted]] = chunk[accepted]
+            seen += chunk.shape[0]
+
+    return reservoir[:filled]
+
+
+def _calculate_z_offset(vertices: np.ndarray, threshold: float, max_iterations: int,
+                        subsample_size: Optional[int] = DEFAULT_SUBSAMPLE_SIZE) -> float:
+    # RANSAC only needs enough points to dominate noise; each inlier-count
+    # pass is O(N), so fitting a uniform subsample cuts the cost by N/size
+    # with essentially identical ground-plane fits
+    if subsample_size is not None and vertices.shape[0] > subsample_size:
+        indices = np.random.default_rng(0).choice(vertices.shape[0], subsample_size, replace=False)
+        vertices = vertices[indices]
+
     # Calculate Z offset from plane equation
-    plane = pyrsc.Plane()
-    plane_eq, inliers = plane.fit(vertices, threshold, maxIteration=max_iterations)
+    plane_eq, _ = _fit_plane_ransac_parallel(vertices, threshold, max_iterations)
 
     A, B, C, D = plane_eq
 
@@ -107,32 +444,152 @@ def _calculate_z_offset(vertices: np.ndarray, threshold: float, max_iterations:
         optimal_offset = -D / C
     else:
         # If plane is vertical, use the mean Z of inlier points
+        inliers = _plane_inliers(vertices, plane_eq, threshold)
         optimal_offset = float(np.mean(vertices[inliers, 2]))
         logger.warning("Plane is nearly vertical, using mean Z of inlier points")
 
     return optimal_offset
 
 
-def _process_obj_line_with_z_offset(line: str, z_offset: float) -> str:
-    original_line = line
-    line = line.strip()
+def _fit_plane_ransac(vertices: np.ndarray, threshold: float, max_iterations: int,
+                      rng: np.random.Generator = None) -> tuple[np.ndarray, int]:
+    """
+    Fit a plane to the vertices with RANSAC, fully vectorized in NumPy.
 
-    if not line:
-        return original_line
+    Candidate planes are sampled and scored in batches so the inner
+    inlier-counting loop runs as SIMD-friendly matrix operations instead
+    of a per-iteration Python loop.
 
-    if line.startswith(VERTEX_PREFIX):
-        parts = line.split()
-        return _apply_z_offset_to_vertex_line(parts, z_offset)
-    else:
-        return original_line
+    Args:
+        vertices: Array of shape (N, 3) containing vertex coordinates
+        threshold: Distance threshold for inlier points
+        max_iterations: Number of candidate planes to sample
+        rng: Optional random generator (useful for reproducibility)
+
+    Returns:
+        tuple[np.ndarray, int]: ([A, B, C, D] with unit normal, inlier count)
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    n_vertices = vertices.shape[0]
+    best_count = 0
+    best_eq = None
+
+    for start in range(0, max_iterations, _RANSAC_BATCH):
+        batch = min(_RANSAC_BATCH, max_iterations - start)
+
+        # Sample 3 points per candidate plane and build unit normals
+        samples = vertices[rng.integers(0, n_vertices, size=(batch, 3))]
+        normals = np.cross(samples[:, 1] - samples[:, 0], samples[:, 2] - samples[:, 0])
+        norms = np.linalg.norm(normals, axis=1)
+        valid = norms > EPSILON  # Degenerate (collinear) samples score zero
+        normals[valid] /= norms[valid, np.newaxis]
+        d = -np.einsum('ij,ij->i', normals, samples[:, 0])
+
+        # Count inliers for the whole batch of planes, block by block
+        counts = np.zeros(batch, dtype=np.int64)
+        for block_start in range(0, n_vertices, _RANSAC_BLOCK):
+            block = vertices[block_start:block_start + _RANSAC_BLOCK]
+            distances = np.abs(block @ normals.T + d)
+            counts += np.count_nonzero(distances < threshold, axis=0)
+        counts[~valid] = 0
+
+        batch_best = int(np.argmax(counts))
+        if counts[batch_best] > best_count:
+            best_count = int(counts[batch_best])
+            best_eq = np.append(normals[batch_best], d[batch_best])
+
+    if best_eq is None:
+        raise ValueError("RANSAC could not fit a plane (all samples degenerate)")
+
+    # Return the plane in float64; the -D/C offset arithmetic downstream
+    # should not inherit the storage precision
+    return best_eq.astype(np.float64), best_count
+
+
+def _fit_plane_ransac_parallel(vertices: np.ndarray, threshold: float,
+                               max_iterations: int) -> tuple[np.ndarray, int]:
+    """
+    Fit a plane with RANSAC, splitting iteration batches across processes.
+
+    The iterations are embarrassingly parallel, so large meshes are scored
+    by a process pool; the vertex array is shared via shared memory to avoid
+    pickling it to every worker. Small meshes fall back to the single-process
+    kernel, where pool spawn overhead would dominate.
+
+    Returns:
+        tuple[np.ndarray, int]: ([A, B, C, D] with unit normal, inlier count)
+    """
+    n_workers = min(os.cpu_count() or 1, max_iterations)
+    if n_workers <= 1 or vertices.shape[0] < _RANSAC_PARALLEL_MIN_VERTICES:
+        return _fit_plane_ransac(vertices, threshold, max_iterations)
+
+    shm = shared_memory.SharedMemory(create=True, size=vertices.nbytes)
+    try:
+        shared = np.ndarray(vertices.shape, dtype=vertices.dtype, buffer=shm.buf)
+        shared[:] = vertices
+
+        iterations_per_worker = [max_iterations // n_workers] * n_workers
+        for i in range(max_iterations % n_workers):
+            iterations_per_worker[i] += 1
+
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            futures = [
+                pool.submit(_ransac_worker, shm.name, vertices.shape, vertices.dtype.str,
+                            threshold, iterations, seed)
+                for seed, iterations in enumerate(iterations_per_worker)
+            ]
+            results = [future.result() for future in futures]
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return max(results, key=lambda result: result[1])
+
+
+def _ransac_worker(shm_name: str, shape: tuple, dtype_str: str,
+                   threshold: float, iterations: int, seed: int) -> tuple[np.ndarray, int]:
+    """Score one batch of RANSAC iterations against the shared vertex array."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        vertices = np.ndarray(shape, dtype=np.dtype(dtype_str), buffer=shm.buf)
+        # Deterministic per-worker seed keeps runs reproducible
+        return _fit_plane_ransac(vertices, threshold, iterations, np.random.default_rng(seed))
+    finally:
+        shm.close()
+
+
+def _plane_inliers(vertices: np.ndarray, plane_eq: np.ndarray, threshold: float) -> np.ndarray:
+    """Boolean mask of vertices within threshold of the plane (unit normal assumed)."""
+    # Evaluate in the vertices' dtype so float32 input is not promoted
+    plane_eq = plane_eq.astype(vertices.dtype, copy=False)
+    distances = np.abs(vertices @ plane_eq[:3] + plane_eq[3])
+    return distances < threshold
+
+
+def _offset_vertex_lines(data: bytes, z_offset: float) -> bytes:
+    """
+    Apply the Z offset to all vertex lines in an in-memory OBJ buffer.
+
+    Vertex lines are located with a single C-level regex split, their Z
+    values are adjusted in one vectorized array operation, and everything
+    else is copied through verbatim. Only the Z token itself is replaced:
+    the line's original indentation, separators, X/Y text, line endings and
+    trailing vertex attributes all pass through byte-identical.
+    """
+    # pieces = [text, prefix-through-Y, z, text, prefix-through-Y, z, ..., text]
+    pieces = _VERTEX_Z_RE.split(data)
+    if len(pieces) == 1:
+        return data
 
+    z = np.array(pieces[2::3], dtype=np.float64) - z_offset
 
-def _apply_z_offset_to_vertex_line(parts: List[str], z_offset: float) -> str:
-    if len(parts) < 4:
-        raise ValueError("Invalid vertex format")
+    new_z = np.char.mod('%s', z).astype(np.bytes_)
+    vertex_lines = np.char.add(np.array(pieces[1::3], dtype=np.bytes_), new_z)
 
-    x = float(parts[1])
-    y = float(parts[2])
-    z = float(parts[3])
-    z_fixed = z - z_offset
-    return f"{VERTEX_PREFIX}{x} {y} {z_fixed}\n"
+    # Interleave rewritten vertex lines with the untouched byte ranges
+    result = np.empty(len(vertex_lines) * 2 + 1, dtype=object)
+    result[0::2] = pieces[0::3]
+    result[1::2] = vertex_lines
+    return b''.join(result)